@@ -5,7 +5,24 @@ MAX_WARC_FILES =10    # stop after this many WARC files
 MAX_HTML_PAGES = 12       # stop after this many HTML pages total
 MAX_IMAGES_PER_PAGE = 5   # max images to download from one HTML
 IMAGE_DOWNLOAD_TIMEOUT = 5  # seconds
+IMAGE_MAX_RETRIES = 1       # images are cheap to lose, don't wait long on them
 MAX_PEOPLE = 10
+ARTICLE_BATCH_SIZE = 50   # Phase 2 articles written to the database per transaction
+
+# ==== Page scoring (Phase 1) ====
+MIN_PAGE_SCORE = 3                 # records scoring below this are skipped
+SCORE_PREFIX_BYTES = 64 * 1024     # bytes of the body inspected when scoring
+MAX_SCORED_RECORDS_PER_WARC = 5000 # stop scanning a WARC file after this many HTML records
+PREFERRED_LANGUAGES = ("en",)      # Content-Language prefixes the NLP models handle
+NEWS_DOMAINS = [
+    "apnews.com", "reuters.com", "bbc.co.uk", "bbc.com", "cnn.com", "nytimes.com",
+    "washingtonpost.com", "theguardian.com", "npr.org", "aljazeera.com", "foxnews.com",
+    "nbcnews.com", "cbsnews.com", "abcnews.go.com", "usatoday.com", "latimes.com",
+    "independent.co.uk", "telegraph.co.uk", "dailymail.co.uk", "huffpost.com",
+    "bloomberg.com", "cnbc.com", "politico.com", "thehill.com", "ahram.org.eg",
+    "egyptindependent.com", "arabnews.com", "thenationalnews.com", "france24.com",
+    "dw.com", "euronews.com", "abc.net.au", "cbc.ca", "timesofindia.indiatimes.com",
+]
 
 # ==== Paths ====
 BASE_DATA_PATH = "data"
@@ -16,12 +33,40 @@ IMAGES_SAVE_PATH = os.path.join(EXTRACTED_DATA_PATH, "images")
 DATABASE_PATH = os.path.join(BASE_DATA_PATH, "database", "bibliotheca_alexandrina.db")
 LFW_DATASET_PATH = os.path.join(BASE_DATA_PATH, "datasets", "lfw")
 WARC_FILES_PATH = os.path.join(BASE_DATA_PATH, "warc_files")
+EXPORT_PATH = os.path.join(BASE_DATA_PATH, "exports")
+HTTP_CACHE_PATH = os.path.join(BASE_DATA_PATH, "http_cache")
+MAPPINGS_PATH = os.path.join(EXTRACTED_DATA_PATH, "mappings.jsonl")  # one PageMapping per line
 
 DB_PATH = DATABASE_PATH
 
 # ==== Common Crawl index ====
 COMMON_CRAWL_INDEX = "https://data.commoncrawl.org/crawl-data/CC-MAIN-2023-14/warc.paths.gz"
+CRAWL_ID = COMMON_CRAWL_INDEX.rstrip("/").split("/")[-2]   # e.g. CC-MAIN-2023-14
+
+# ==== HTTP fetching ====
+HTTP_MAX_RETRIES = 4              # retries after the first attempt
+HTTP_BACKOFF_BASE = 1.0           # seconds, doubled on every retry
+HTTP_BACKOFF_MAX = 60.0           # cap on a single backoff delay
+WARC_DOWNLOAD_TIMEOUT = (10, 60)  # (connect, read) seconds
+CIRCUIT_FAILURE_THRESHOLD = 3     # consecutive failures before a host is skipped
+CIRCUIT_COOLDOWN = 300            # seconds a failing host is skipped for
+
+# ==== Person linking (Phase 4) ====
+FACE_MATCH_TOLERANCE = 0.6     # max face distance when matching against people named in the article
+FACE_GLOBAL_TOLERANCE = 0.5    # stricter limit when falling back to the whole gallery
+PERSON_FUZZY_THRESHOLD = 0.85  # min name similarity for a fuzzy text match
+GLOBAL_MATCH_WEIGHT = 0.8      # below any name score, so text-backed matches outrank global ones
+LINK_BATCH_SIZE = 200          # images linked per database transaction
+PERSON_ALIASES = {             # gallery name -> other ways articles refer to them
+    "George W Bush": ["George Bush", "Dubya"],
+    "Tony Blair": ["Anthony Blair"],
+}
+
+# ==== Columnar export ====
+EXPORT_FORMAT = "parquet"     # "parquet" or "ipc" (Arrow IPC / Feather v2, zero-copy memory-mapped reads)
+EXPORT_BATCH_SIZE = 5000      # rows fetched from SQLite per Arrow record batch
+FACE_ENCODING_DIM = 128       # face_recognition encodings are 128-d vectors
 
 # ==== Ensure required directories exist ====
-for path in [HTML_SAVE_PATH, IMAGES_SAVE_PATH, os.path.dirname(DATABASE_PATH), LFW_DATASET_PATH, WARC_FILES_PATH]:
+for path in [HTML_SAVE_PATH, IMAGES_SAVE_PATH, os.path.dirname(DATABASE_PATH), LFW_DATASET_PATH, WARC_FILES_PATH, EXPORT_PATH, HTTP_CACHE_PATH]:
     os.makedirs(path, exist_ok=True)
@@ -8,6 +8,14 @@ class FaceProcessor:
 
     # create encode for image after laod of img
     def get_face_encoding(self, image_path):
+        encodings = self.get_face_encodings(image_path)
+        if len(encodings) > 0:
+            # Convert numpy array to list for JSON storage
+            return encodings[0].tolist()
+        return None
+
+    # All face encodings in an image, for matching article images with several people
+    def get_face_encodings(self, image_path):
 
         try:
             image = face_recognition.load_image_file(image_path)
@@ -16,18 +24,10 @@ class FaceProcessor:
             face_locations = face_recognition.face_locations(image)
 
             if len(face_locations) == 0:
-                return None
+                return []
 
             # Encode faces using the detected locations
-            encodings = face_recognition.face_encodings(image, face_locations)
-
-            if len(encodings) > 0:
-                # Convert numpy array to list for JSON storage
-                return encodings[0].tolist()
-
-            return None
+            return face_recognition.face_encodings(image, face_locations)
         except Exception as e:
             print(f"Error processing image {image_path}: {e}")
-            return None
-
-
+            return []
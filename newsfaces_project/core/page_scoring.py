@@ -0,0 +1,79 @@
+# core/page_scoring.py
+# Cheap pre-filter for Phase 1: estimate from the URL and the first bytes of
+# an HTML response whether a record is a news article with pictures of people.
+import re
+from urllib.parse import urlparse
+from config import settings
+
+ARTICLE_PATH_RE = re.compile(r"/(news|article|articles|story|stories|politics|world|sport|sports)/|/20\d\d/\d{1,2}/", re.I)
+LISTING_PATH_RE = re.compile(r"/(tag|tags|category|categories|search|login|signin|register|cart|account)(/|$)", re.I)
+SLUG_RE = re.compile(r"/[a-z0-9]+(-[a-z0-9]+){3,}(\.html?)?/?$", re.I)
+
+OG_ARTICLE_RE = re.compile(rb"<meta[^>]+property=[\"']og:type[\"'][^>]+content=[\"']article", re.I)
+OG_IMAGE_RE = re.compile(rb"<meta[^>]+property=[\"']og:image[\"']", re.I)
+PUBLISHED_RE = re.compile(rb"article:published_time|itemprop=[\"']datePublished|\"datePublished\"", re.I)
+ARTICLE_TAG_RE = re.compile(rb"<article[\s>]", re.I)
+BYLINE_RE = re.compile(
+    rb"rel=[\"']author[\"']|itemprop=[\"']author[\"']|<meta[^>]+name=[\"']author[\"']|class=[\"'][^\"']*byline"
+    rb"|>\s*By\s+[A-Z][a-z]+\s+[A-Z][a-z]+",
+)
+IMG_TAG_RE = re.compile(rb"<img[\s>]", re.I)
+
+
+def is_news_domain(url):
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == domain or host.endswith("." + domain) for domain in settings.NEWS_DOMAINS)
+
+
+def score_url(url):
+    parsed = urlparse(url or "")
+    path = parsed.path or "/"
+    score = 0
+    if is_news_domain(url):
+        score += 3
+    if ARTICLE_PATH_RE.search(path):
+        score += 1
+    if SLUG_RE.search(path):
+        score += 1
+    if path == "/" or LISTING_PATH_RE.search(path):
+        score -= 2
+    return score
+
+
+# Images only count once the page shows at least one article or person
+# signal (og:type=article, byline, published time, <article>, or a news
+# domain); otherwise any gallery or shop page would clear MIN_PAGE_SCORE.
+def score_body_prefix(body_prefix, news_domain=False):
+    score = 0
+    article_signal = news_domain
+    if OG_ARTICLE_RE.search(body_prefix):
+        score += 3
+        article_signal = True
+    if BYLINE_RE.search(body_prefix):
+        score += 2
+        article_signal = True
+    if PUBLISHED_RE.search(body_prefix):
+        score += 1
+        article_signal = True
+    if ARTICLE_TAG_RE.search(body_prefix):
+        score += 1
+        article_signal = True
+    if OG_IMAGE_RE.search(body_prefix):
+        score += 1
+
+    img_count = len(IMG_TAG_RE.findall(body_prefix))
+    if img_count == 0:
+        score -= 2
+    elif article_signal:
+        score += min(img_count, 3)
+    return score
+
+
+# Higher is better; records below settings.MIN_PAGE_SCORE are not worth the
+# save, image download and NLP work.
+def score_page(url, http_headers, body_prefix):
+    content_language = http_headers.get_header("Content-Language", "") if http_headers else ""
+    score = score_url(url) + score_body_prefix(body_prefix, news_domain=is_news_domain(url))
+    if content_language and not content_language.lower().startswith(settings.PREFERRED_LANGUAGES):
+        score -= 1
+    return score
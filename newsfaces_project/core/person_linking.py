@@ -0,0 +1,115 @@
+# core/person_linking.py
+# Match PERSON entities from article text to gallery identities (known_faces)
+# and match detected faces against only those identities.
+import re
+import unicodedata
+from difflib import SequenceMatcher
+import numpy as np
+from config import settings
+
+TITLES = {
+    "mr", "mrs", "ms", "miss", "dr", "prof", "sir", "dame", "president", "pres",
+    "senator", "sen", "rep", "gov", "governor", "prime", "minister", "pope",
+    "judge", "mayor", "jr", "sr",
+}
+
+
+def normalize_name(name):
+    name = unicodedata.normalize("NFKD", name or "")
+    name = "".join(c for c in name if not unicodedata.combining(c))
+    name = re.sub(r"['’]s\b", "", name.replace("_", " ").lower())
+    tokens = re.sub(r"[^a-z\s-]", " ", name).replace("-", " ").split()
+    return " ".join(t for t in tokens if t not in TITLES)
+
+
+class PersonNameIndex:
+    def __init__(self, names, aliases=settings.PERSON_ALIASES):
+        self.exact = {}
+        self.by_last = {}
+        for name in names:
+            normalized = normalize_name(name)
+            if not normalized:
+                continue
+            tokens = normalized.split()
+            self.exact[normalized] = name
+            # "George W Bush" is also "George Bush"
+            if len(tokens) > 2:
+                self.exact.setdefault(f"{tokens[0]} {tokens[-1]}", name)
+            self.by_last.setdefault(tokens[-1], set()).add(name)
+
+        for name, alias_list in aliases.items():
+            if normalize_name(name) in self.exact:
+                for alias in alias_list:
+                    normalized_alias = normalize_name(alias)
+                    if normalized_alias:
+                        self.exact[normalized_alias] = name
+
+        # Fuzzy candidates are bucketed by the initial of the surname
+        self.by_initial = {}
+        for key, name in self.exact.items():
+            self.by_initial.setdefault(key.split()[-1][0], []).append((key, name))
+
+    # Return (gallery_name, score) for a text mention, or None. Surname-only
+    # mentions resolve only when one gallery identity has that surname;
+    # fuzzy matches are limited to identities sharing the surname's initial.
+    def match(self, mention):
+        normalized = normalize_name(mention)
+        if not normalized:
+            return None
+        if normalized in self.exact:
+            return self.exact[normalized], 1.0
+
+        tokens = normalized.split()
+        candidates = self.by_last.get(tokens[-1], set())
+        if len(tokens) == 1 and len(candidates) == 1:
+            return next(iter(candidates)), 0.9
+
+        best, best_score = None, 0.0
+        for key, name in self.by_initial.get(tokens[-1][0], []):
+            score = SequenceMatcher(None, normalized, key).ratio()
+            if score > best_score:
+                best, best_score = name, score
+        if best_score >= settings.PERSON_FUZZY_THRESHOLD:
+            return best, best_score
+        return None
+
+    # Gallery identities named in an article, with the best name score for each
+    def resolve(self, mentions):
+        resolved = {}
+        for mention in mentions:
+            match = self.match(mention)
+            if match and match[1] > resolved.get(match[0], 0.0):
+                resolved[match[0]] = match[1]
+        return resolved
+
+
+class FaceGallery:
+    def __init__(self, known_faces):
+        names, encodings = [], []
+        for name, encoding in known_faces:
+            names.append(name)
+            encodings.append(encoding)
+        self.names = np.array(names, dtype=object)
+        self.encodings = np.array(encodings, dtype=np.float64).reshape(len(encodings), -1)
+        self.rows_by_name = {}
+        for row, name in enumerate(names):
+            self.rows_by_name.setdefault(name, []).append(row)
+
+    def identities(self):
+        return list(self.rows_by_name)
+
+    # Closest identity to a face among candidate_names (all if None), as
+    # (name, distance), or None when nothing is within tolerance.
+    def match(self, face_encoding, candidate_names=None, tolerance=settings.FACE_MATCH_TOLERANCE):
+        if candidate_names is None:
+            rows = np.arange(len(self.names))
+        else:
+            rows = np.array([r for name in candidate_names for r in self.rows_by_name.get(name, [])], dtype=int)
+        if rows.size == 0:
+            return None
+
+        distances = np.linalg.norm(self.encodings[rows] - np.asarray(face_encoding), axis=1)
+        best = int(np.argmin(distances))
+        if distances[best] > tolerance:
+            return None
+        return self.names[rows[best]], float(distances[best])
@@ -0,0 +1,38 @@
+# core/records.py
+# Compact records passed between WARCService, TextService and DatabaseManager.
+# slots=True drops the per-instance __dict__, and list fields are tuples.
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class PageMapping:
+    url: str
+    html_path: str          # relative to settings.BASE_DATA_PATH
+    images: tuple = ()      # relative to settings.BASE_DATA_PATH
+
+    def to_dict(self):
+        return {"url": self.url, "html_path": self.html_path, "images": list(self.images)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            url=data.get("url") or data.get("target_uri"),
+            html_path=data.get("html_path", ""),
+            images=tuple(data.get("images", ())),
+        )
+
+
+@dataclass(slots=True)
+class ArticleRecord:
+    target_uri: str
+    title: str
+    cleaned_text: str
+    language: str
+    sentiment_label: str
+    sentiment_score: float
+    topic_category: str
+    keywords: tuple = ()
+    person_entities: tuple = ()
+    org_entities: tuple = ()
+    location_entities: tuple = ()
+    image_paths: tuple = ()  # full paths, stored in the images table
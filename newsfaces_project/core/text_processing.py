@@ -6,6 +6,7 @@ import spacy
 from keybert import KeyBERT
 from transformers import pipeline
 from sklearn.feature_extraction.text import TfidfVectorizer
+from core.records import ArticleRecord
 
 
 class TextMetadataExtractor:
@@ -135,16 +136,16 @@ class TextMetadataExtractor:
         sentiment_label, sentiment_score = self.analyze_sentiment(cleaned_text)
         topic_category, _ = self.classify_topic(cleaned_text, title)
 
-        return {
-            "target_uri": metadata.get("target_uri") if metadata else None,
-            "title": title,
-            "cleaned_text": cleaned_text,
-            "language": language,
-            "sentiment_label": sentiment_label,
-            "sentiment_score": sentiment_score,
-            "topic_category": topic_category,
-            "keywords": keywords,
-            "person_entities": persons,
-            "org_entities": orgs,
-            "location_entities": locations
-        }
+        return ArticleRecord(
+            target_uri=metadata.get("target_uri") if metadata else None,
+            title=title,
+            cleaned_text=cleaned_text,
+            language=language,
+            sentiment_label=sentiment_label,
+            sentiment_score=sentiment_score,
+            topic_category=topic_category,
+            keywords=tuple(keywords),
+            person_entities=tuple(persons),
+            org_entities=tuple(orgs),
+            location_entities=tuple(locations)
+        )
@@ -0,0 +1,182 @@
+# data_access/columnar_exporter.py
+import os
+import json
+import logging
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import fs
+from config import settings
+
+ENCODING_TYPE = pa.list_(pa.float32(), settings.FACE_ENCODING_DIM)
+
+ARTICLES_SCHEMA = pa.schema([
+    ("article_id", pa.int64()),
+    ("target_uri", pa.string()),
+    ("title", pa.string()),
+    ("cleaned_text", pa.string()),
+    ("sentiment_label", pa.string()),
+    ("sentiment_score", pa.float64()),
+    ("topic_category", pa.string()),
+    ("keywords", pa.list_(pa.string())),
+    ("person_entities", pa.list_(pa.string())),
+    ("org_entities", pa.list_(pa.string())),
+    ("location_entities", pa.list_(pa.string())),
+    ("crawl", pa.string()),
+    ("language", pa.string()),
+])
+
+IMAGES_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("article_id", pa.int64()),
+    ("image_path", pa.string()),
+    ("crawl", pa.string()),
+    ("language", pa.string()),
+])
+
+KNOWN_FACES_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("name", pa.string()),
+    ("encoding", ENCODING_TYPE),
+])
+
+CRAWL_LANGUAGE_PARTITIONING = ds.partitioning(
+    pa.schema([("crawl", pa.string()), ("language", pa.string())]),
+    flavor="hive"
+)
+
+FILE_EXTENSIONS = {"parquet": "parquet", "ipc": "arrow"}
+
+
+# Decode a JSON list column from SQLite; anything malformed becomes an empty list
+def _json_list(value):
+    if value is None:
+        return []
+    try:
+        decoded = json.loads(value)
+    except (TypeError, ValueError):
+        return []
+    return [str(x) for x in decoded] if isinstance(decoded, list) else []
+
+
+class ColumnarExporter:
+    def __init__(self, db, export_dir=settings.EXPORT_PATH, file_format=settings.EXPORT_FORMAT):
+        if file_format not in FILE_EXTENSIONS:
+            raise ValueError(f"Unsupported export format: {file_format}")
+        self.db = db
+        self.export_dir = export_dir
+        self.file_format = file_format
+        self.state_file = os.path.join(self.export_dir, "export_state.json")
+        os.makedirs(self.export_dir, exist_ok=True)
+
+    # ==== Watermarks (last exported id per table) ====
+    def load_state(self):
+        if not os.path.exists(self.state_file):
+            return {}
+        with open(self.state_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_state(self, state):
+        tmp_file = self.state_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_file, self.state_file)
+
+    # ==== Row -> record batch conversion ====
+    def _article_batch(self, rows):
+        columns = list(zip(*rows))
+        return pa.record_batch([
+            pa.array(columns[0], type=pa.int64()),
+            pa.array(columns[1], type=pa.string()),
+            pa.array(columns[2], type=pa.string()),
+            pa.array(columns[3], type=pa.string()),
+            pa.array(columns[5], type=pa.string()),
+            pa.array(columns[6], type=pa.float64()),
+            pa.array(columns[7], type=pa.string()),
+            pa.array([_json_list(v) for v in columns[8]], type=pa.list_(pa.string())),
+            pa.array([_json_list(v) for v in columns[9]], type=pa.list_(pa.string())),
+            pa.array([_json_list(v) for v in columns[10]], type=pa.list_(pa.string())),
+            pa.array([_json_list(v) for v in columns[11]], type=pa.list_(pa.string())),
+            pa.array([settings.CRAWL_ID] * len(rows), type=pa.string()),
+            pa.array([lang or "unknown" for lang in columns[4]], type=pa.string()),
+        ], schema=ARTICLES_SCHEMA)
+
+    def _image_batch(self, rows):
+        columns = list(zip(*rows))
+        return pa.record_batch([
+            pa.array(columns[0], type=pa.int64()),
+            pa.array(columns[1], type=pa.int64()),
+            pa.array(columns[2], type=pa.string()),
+            pa.array([settings.CRAWL_ID] * len(rows), type=pa.string()),
+            pa.array([lang or "unknown" for lang in columns[3]], type=pa.string()),
+        ], schema=IMAGES_SCHEMA)
+
+    def _known_face_batch(self, rows):
+        ids, names, encodings = [], [], []
+        for face_id, name, encoding in rows:
+            try:
+                values = json.loads(encoding) if encoding else []
+            except ValueError:
+                values = []
+            if len(values) != settings.FACE_ENCODING_DIM:
+                logging.warning(f"Skipping known face id={face_id}: encoding has {len(values)} values")
+                continue
+            ids.append(face_id)
+            names.append(name)
+            encodings.append(values)
+        return pa.record_batch([
+            pa.array(ids, type=pa.int64()),
+            pa.array(names, type=pa.string()),
+            pa.array(encodings, type=ENCODING_TYPE),
+        ], schema=KNOWN_FACES_SCHEMA)
+
+    # ==== Writing ====
+    def _export_table(self, table_name, row_batches, to_batch, schema, partitioning, state):
+        last_id = state.get(table_name, 0)
+        progress = {"last_id": last_id, "rows": 0}
+
+        def record_batches():
+            for rows in row_batches(last_id, settings.EXPORT_BATCH_SIZE):
+                progress["last_id"] = rows[-1][0]
+                batch = to_batch(rows)
+                progress["rows"] += batch.num_rows
+                yield batch
+
+        # Files are named after the first id of this export, so re-running an
+        # export that crashed before the watermark was saved overwrites them.
+        ds.write_dataset(
+            record_batches(),
+            os.path.join(self.export_dir, table_name),
+            schema=schema,
+            format=self.file_format,
+            partitioning=partitioning,
+            basename_template=f"part-{last_id + 1:012d}-{{i}}.{FILE_EXTENSIONS[self.file_format]}",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+
+        state[table_name] = progress["last_id"]
+        self._save_state(state)
+        logging.info(f"Exported {progress['rows']} new {table_name} rows (last id {progress['last_id']})")
+        return progress["rows"]
+
+    def export_articles(self, state):
+        return self._export_table("articles", self.db.iter_articles_since, self._article_batch,
+                                  ARTICLES_SCHEMA, CRAWL_LANGUAGE_PARTITIONING, state)
+
+    def export_images(self, state):
+        return self._export_table("images", self.db.iter_images_since, self._image_batch,
+                                  IMAGES_SCHEMA, CRAWL_LANGUAGE_PARTITIONING, state)
+
+    def export_known_faces(self, state):
+        return self._export_table("known_faces", self.db.iter_known_faces_since, self._known_face_batch,
+                                  KNOWN_FACES_SCHEMA, None, state)
+
+    # ==== Reading ====
+    # Open an exported table as a dataset; local files are memory-mapped so
+    # Arrow IPC exports are read zero-copy.
+    def open_dataset(self, table_name):
+        return ds.dataset(
+            os.path.abspath(os.path.join(self.export_dir, table_name)),
+            format=self.file_format,
+            partitioning="hive",
+            filesystem=fs.LocalFileSystem(use_mmap=True),
+        )
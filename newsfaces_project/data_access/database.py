@@ -57,56 +57,103 @@ class DatabaseManager:
                 )
             ''')
 
+            # Person links: faces in article images matched to gallery identities
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS person_links (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    article_id INTEGER,
+                    image_id INTEGER,
+                    person_name TEXT,
+                    confidence REAL,
+                    match_source TEXT,
+                    FOREIGN KEY(article_id) REFERENCES articles(article_id),
+                    FOREIGN KEY(image_id) REFERENCES images(id)
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_person_links_article ON person_links(article_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_person_links_image ON person_links(image_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_person_links_person ON person_links(person_name)')
+
+            # Phase 4 watermark: last linked images.id and the gallery it was linked against
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS link_state (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    last_image_id INTEGER,
+                    gallery_signature TEXT
+                )
+            ''')
+
             conn.commit()
             conn.close()
         except Exception as e:
             print(f"Error initializing database: {e}")
             traceback.print_exc()
 
-    # Insert article into reduced schema
-    def insert_article(self, article_data):
+    # Insert one ArticleRecord and its images; the caller commits
+    def _insert_article_record(self, cursor, record):
+        cursor.execute('''
+            INSERT INTO articles (
+                target_uri, title, cleaned_text, language, sentiment_label,
+                sentiment_score, topic_category, keywords,
+                person_entities, org_entities, location_entities
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            record.target_uri,
+            record.title,
+            record.cleaned_text,
+            record.language,
+            record.sentiment_label,
+            record.sentiment_score,
+            record.topic_category,
+            json.dumps(record.keywords, ensure_ascii=False),
+            json.dumps(record.person_entities, ensure_ascii=False),
+            json.dumps(record.org_entities, ensure_ascii=False),
+            json.dumps(record.location_entities, ensure_ascii=False)
+        ))
+        article_id = cursor.lastrowid
+        cursor.executemany('''
+            INSERT INTO images (article_id, image_path)
+            VALUES (?, ?)
+        ''', [(article_id, path) for path in record.image_paths])
+        return article_id
+
+    # Insert a batch of ArticleRecords and their images in one transaction.
+    # List fields are JSON-encoded here, once, when the batch is flushed.
+    # If the batch fails, records are retried one by one so a single bad
+    # article doesn't drop the rest. Returns one id per record, None for
+    # records that could not be stored.
+    def insert_articles(self, records):
+        if not records:
+            return []
 
+        conn = self._connect()
         try:
-            conn = self._connect()
             cursor = conn.cursor()
+            try:
+                article_ids = [self._insert_article_record(cursor, record) for record in records]
+                conn.commit()
+                return article_ids
+            except Exception as e:
+                conn.rollback()
+                print(f"Error inserting batch of {len(records)} articles, retrying one by one: {e}")
 
-            cursor.execute('''
-                INSERT INTO articles (
-                    target_uri, title, cleaned_text, language, sentiment_label,
-                    sentiment_score, topic_category, keywords,
-                    person_entities, org_entities, location_entities
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                article_data.get('target_uri'),
-                article_data.get('title'),
-                article_data.get('cleaned_text'),
-                article_data.get('language'),
-                article_data.get('sentiment_label'),
-                article_data.get('sentiment_score'),
-                article_data.get('topic_category'),
-                json.dumps(article_data.get('keywords', []), ensure_ascii=False)
-                    if not isinstance(article_data.get('keywords'), str)
-                    else article_data.get('keywords'),
-                json.dumps(article_data.get('person_entities', []), ensure_ascii=False)
-                    if not isinstance(article_data.get('person_entities'), str)
-                    else article_data.get('person_entities'),
-                json.dumps(article_data.get('org_entities', []), ensure_ascii=False)
-                    if not isinstance(article_data.get('org_entities'), str)
-                    else article_data.get('org_entities'),
-                json.dumps(article_data.get('location_entities', []), ensure_ascii=False)
-                    if not isinstance(article_data.get('location_entities'), str)
-                    else article_data.get('location_entities')
-            ))
-
-            article_id = cursor.lastrowid
-            conn.commit()
+            article_ids = []
+            for record in records:
+                try:
+                    article_ids.append(self._insert_article_record(cursor, record))
+                    conn.commit()
+                except Exception as e:
+                    conn.rollback()
+                    print(f"Error inserting article {record.target_uri}: {e}")
+                    traceback.print_exc()
+                    article_ids.append(None)
+            return article_ids
+        finally:
             conn.close()
-            return article_id
 
-        except Exception as e:
-            print(f"Error inserting article: {e}")
-            traceback.print_exc()
-            return None
+    def insert_article(self, record):
+        article_ids = self.insert_articles([record])
+        return article_ids[0] if article_ids else None
 
     def insert_image(self, article_id, image_path):
         conn = self._connect()
@@ -128,6 +175,119 @@ class DatabaseManager:
         conn.commit()
         conn.close()
 
+    # Yield rows with id > last_id in ascending id order, batch_size rows at a
+    # time. Each batch is a separate query keyed on the last id seen, so no
+    # read lock is held while the caller writes between batches.
+    def _iter_batches(self, query, last_id, batch_size):
+        while True:
+            conn = self._connect()
+            cursor = conn.cursor()
+            cursor.execute(query + ' LIMIT ?', (last_id, batch_size))
+            rows = cursor.fetchall()
+            conn.close()
+            if not rows:
+                break
+            yield rows
+            last_id = rows[-1][0]
+
+    def iter_articles_since(self, last_id, batch_size):
+        return self._iter_batches('''
+            SELECT article_id, target_uri, title, cleaned_text, language, sentiment_label,
+                   sentiment_score, topic_category, keywords,
+                   person_entities, org_entities, location_entities
+            FROM articles
+            WHERE article_id > ?
+            ORDER BY article_id
+        ''', last_id, batch_size)
+
+    def iter_images_since(self, last_id, batch_size):
+        return self._iter_batches('''
+            SELECT images.id, images.article_id, images.image_path, articles.language
+            FROM images
+            LEFT JOIN articles ON articles.article_id = images.article_id
+            WHERE images.id > ?
+            ORDER BY images.id
+        ''', last_id, batch_size)
+
+    def iter_known_faces_since(self, last_id, batch_size):
+        return self._iter_batches('''
+            SELECT id, name, encoding
+            FROM known_faces
+            WHERE id > ?
+            ORDER BY id
+        ''', last_id, batch_size)
+
+    def iter_images_with_articles(self, last_id, batch_size):
+        return self._iter_batches('''
+            SELECT images.id, images.article_id, images.image_path, articles.person_entities
+            FROM images
+            JOIN articles ON articles.article_id = images.article_id
+            WHERE images.id > ?
+            ORDER BY images.id
+        ''', last_id, batch_size)
+
+    def get_known_faces(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('SELECT name, encoding FROM known_faces')
+        rows = [(name, json.loads(encoding)) for name, encoding in cursor.fetchall()]
+        conn.close()
+        return rows
+
+    # (last linked images.id, gallery signature) from the previous Phase 4 run
+    def get_link_state(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('SELECT last_image_id, gallery_signature FROM link_state WHERE id = 1')
+        row = cursor.fetchone()
+        conn.close()
+        return row if row else (0, None)
+
+    # link_batches yields (links, last_image_id) pairs, links being
+    # (article_id, image_id, person_name, confidence, match_source) tuples.
+    # Incremental runs commit each batch with its watermark; a rebuild clears
+    # the table and refills it in a single transaction, so a crash leaves the
+    # previous links in place.
+    def store_person_links(self, link_batches, rebuild, gallery_signature):
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            if rebuild:
+                cursor.execute('DELETE FROM person_links')
+                cursor.execute('DELETE FROM link_state')
+
+            for links, last_image_id in link_batches:
+                cursor.executemany('''
+                    INSERT INTO person_links (article_id, image_id, person_name, confidence, match_source)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', links)
+                cursor.execute('''
+                    INSERT OR REPLACE INTO link_state (id, last_image_id, gallery_signature)
+                    VALUES (1, ?, ?)
+                ''', (last_image_id, gallery_signature))
+                if not rebuild:
+                    conn.commit()
+
+            # Record the gallery even when there were no new images
+            cursor.execute('''
+                INSERT OR IGNORE INTO link_state (id, last_image_id, gallery_signature)
+                VALUES (1, 0, ?)
+            ''', (gallery_signature,))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def get_person_link_count(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('SELECT COUNT(*) FROM person_links')
+        count = cursor.fetchone()[0]
+        conn.close()
+        return count
+
     def get_article_count(self):
         conn = self._connect()
         cursor = conn.cursor()
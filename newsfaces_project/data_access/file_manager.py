@@ -2,13 +2,14 @@
 import os
 import json
 import logging
-import requests
 from urllib.parse import urlparse
 from config import settings
+from core.records import PageMapping
+from data_access.http_fetcher import HTTPFetcher, CircuitOpenError
 
 class FileManager:
-    def __init__(self):
-        pass
+    def __init__(self, fetcher=None):
+        self.fetcher = fetcher or HTTPFetcher()
 
     def save_html(self, html_content, html_filename):
         html_path = os.path.join(settings.HTML_SAVE_PATH, html_filename)
@@ -24,21 +25,34 @@ class FileManager:
             if count >= settings.MAX_IMAGES_PER_PAGE:
                 break
             try:
-                response = requests.get(img_url, timeout=settings.IMAGE_DOWNLOAD_TIMEOUT)
-                if response.status_code == 200:
-                    img_name = os.path.basename(urlparse(img_url).path) or f"image_{count}.jpg"
-                    img_path = os.path.join(settings.IMAGES_SAVE_PATH, f"{html_base_name}_{img_name}")
+                img_name = os.path.basename(urlparse(img_url).path) or f"image_{count}.jpg"
+                img_path = os.path.join(settings.IMAGES_SAVE_PATH, f"{html_base_name}_{img_name}")
+                # The saved image doubles as the cached body for revalidation
+                content = self.fetcher.get(img_url, timeout=settings.IMAGE_DOWNLOAD_TIMEOUT,
+                                           max_retries=settings.IMAGE_MAX_RETRIES, saved_path=img_path)
+                if content is not None:
                     with open(img_path, "wb") as f:
-                        f.write(response.content)
+                        f.write(content)
                     saved_images.append(img_path)
                     logging.info(f"Downloaded image: {img_path}")
                     count += 1
+            except CircuitOpenError:
+                logging.debug(f"Skipping image {img_url}: host is cooling down")
             except Exception as e:
                 logging.warning(f"Error downloading image {img_url}: {e}")
         return saved_images
 
-    def save_mappings(self, mappings_data):
-        mapping_file = os.path.join(settings.EXTRACTED_DATA_PATH, "mappings.json")
-        with open(mapping_file, "w") as f:
-            json.dump(mappings_data, f, indent=2)
-        logging.info(f"Saved mappings.json with {len(mappings_data)} entries.")
+    # mappings.jsonl is written one line per saved page and read back as a
+    # stream, so neither phase holds all mappings in memory.
+    def reset_mappings(self):
+        open(settings.MAPPINGS_PATH, "w", encoding="utf-8").close()
+
+    def append_mapping(self, mapping):
+        with open(settings.MAPPINGS_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(mapping.to_dict(), ensure_ascii=False) + "\n")
+
+    def iter_mappings(self):
+        with open(settings.MAPPINGS_PATH, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield PageMapping.from_dict(json.loads(line))
@@ -0,0 +1,245 @@
+# data_access/http_fetcher.py
+# Shared HTTP layer for WARC and image downloads: retries with exponential
+# backoff, per-host circuit breakers, resumable file downloads and a small
+# on-disk cache that revalidates with ETag / Last-Modified.
+import os
+import json
+import time
+import random
+import hashlib
+import logging
+import requests
+from urllib.parse import urlparse
+from config import settings
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a host is in its cool-down period and requests are skipped."""
+
+
+class RetryableHTTPError(Exception):
+    pass
+
+
+class DownloadVerificationError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+                 cooldown=settings.CIRCUIT_COOLDOWN):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = {}
+        self.opened_at = {}
+
+    # Closed or half-open (cool-down elapsed) hosts may be tried
+    def allow(self, host):
+        opened_at = self.opened_at.get(host)
+        return opened_at is None or time.monotonic() - opened_at >= self.cooldown
+
+    def record_success(self, host):
+        self.failures.pop(host, None)
+        self.opened_at.pop(host, None)
+
+    def record_failure(self, host):
+        self.failures[host] = self.failures.get(host, 0) + 1
+        if self.failures[host] >= self.failure_threshold:
+            if host not in self.opened_at or self.allow(host):
+                logging.warning(f"Circuit open for {host}: skipping it for {self.cooldown}s")
+            self.opened_at[host] = time.monotonic()
+
+
+class HTTPFetcher:
+    def __init__(self, cache_dir=settings.HTTP_CACHE_PATH, max_retries=settings.HTTP_MAX_RETRIES):
+        self.cache_dir = cache_dir
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        self.breaker = CircuitBreaker()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # ==== Retry / circuit breaker core ====
+    def _send(self, url, headers=None, timeout=None, stream=False):
+        host = urlparse(url).netloc
+        if not self.breaker.allow(host):
+            raise CircuitOpenError(host)
+
+        response = self.session.get(url, headers=headers, timeout=timeout, stream=stream)
+        if response.status_code in RETRYABLE_STATUS:
+            response.close()
+            raise RetryableHTTPError(f"HTTP {response.status_code} for {url}")
+        return response
+
+    # The breaker counts one failure per call whose retries are all used up,
+    # so a single download's retries never open the circuit on their own.
+    # CircuitOpenError from the attempt is raised straight away.
+    def _with_retries(self, attempt, url, max_retries=None):
+        host = urlparse(url).netloc
+        max_retries = self.max_retries if max_retries is None else max_retries
+        for retry in range(max_retries + 1):
+            try:
+                result = attempt()
+            except (requests.ConnectionError, requests.Timeout,
+                    requests.exceptions.ChunkedEncodingError, RetryableHTTPError) as e:
+                if retry == max_retries:
+                    self.breaker.record_failure(host)
+                    raise
+                delay = min(settings.HTTP_BACKOFF_BASE * (2 ** retry), settings.HTTP_BACKOFF_MAX)
+                delay += random.uniform(0, delay / 4)
+                logging.warning(f"Fetch failed for {url} ({e}); retry {retry + 1}/{max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+            else:
+                self.breaker.record_success(host)
+                return result
+
+    # ==== Cached GET ====
+    def _cache_paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key + ".body"), os.path.join(self.cache_dir, key + ".json")
+
+    # Keep the validators for url. When the caller saves the body itself
+    # (saved_path), only a pointer to that file is kept, so the body is not
+    # stored twice on disk.
+    def _store_in_cache(self, url, response, saved_path=None):
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        body_path, meta_path = self._cache_paths(url)
+        if saved_path is None:
+            with open(body_path + ".tmp", "wb") as f:
+                f.write(response.content)
+            os.replace(body_path + ".tmp", body_path)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body_path": saved_path or body_path,
+            }, f)
+
+    # Return the response body, or None for non-200 responses. Raises
+    # CircuitOpenError without touching the network if the host is cooling down.
+    # Pass saved_path when the caller writes the body to that file itself.
+    def get(self, url, timeout=None, max_retries=None, saved_path=None):
+        body_path, meta_path = self._cache_paths(url)
+        headers = {}
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            body_path = meta.get("body_path", body_path)
+            # Only revalidate while the cached body is still on disk
+            if os.path.exists(body_path):
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self._with_retries(lambda: self._send(url, headers, timeout), url, max_retries)
+        if response.status_code == 304:
+            with open(body_path, "rb") as f:
+                return f.read()
+        if response.status_code != 200:
+            return None
+
+        self._store_in_cache(url, response, saved_path)
+        return response.content
+
+    # ==== Resumable download ====
+    def _download_attempt(self, url, part_path, state_path, timeout):
+        state = {}
+        if os.path.exists(state_path):
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+        # Byte ranges refer to the stored bytes, so ask for them uncompressed
+        headers = {"Accept-Encoding": "identity"}
+        if offset and state.get("url") == url:
+            headers["Range"] = f"bytes={offset}-"
+            # Only resume if the remote file is unchanged; otherwise the server sends it whole
+            if state.get("etag") or state.get("last_modified"):
+                headers["If-Range"] = state.get("etag") or state.get("last_modified")
+        else:
+            offset = 0
+
+        response = self._send(url, headers, timeout, stream=True)
+        with response:
+            if response.status_code == 416:
+                if state.get("total") == offset:
+                    return state["total"]
+                os.remove(part_path)
+                raise RetryableHTTPError(f"Stale partial download of {url}, restarting")
+            if response.status_code not in (200, 206):
+                raise DownloadVerificationError(f"HTTP {response.status_code} for {url}")
+
+            if response.status_code == 206:
+                content_range_total = response.headers.get("Content-Range", "").rsplit("/", 1)[-1]
+                total = int(content_range_total) if content_range_total.isdigit() else None
+                mode = "ab"
+            else:
+                length = response.headers.get("Content-Length")
+                total = int(length) if length else None
+                offset = 0
+                mode = "wb"
+
+            with open(state_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "total": total,
+                }, f)
+
+            if offset:
+                logging.info(f"Resuming {url} at byte {offset}")
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+
+        # A connection that closed early is resumed on the next attempt
+        if total is not None and os.path.getsize(part_path) < total:
+            raise RetryableHTTPError(f"Incomplete download of {url}: {os.path.getsize(part_path)}/{total} bytes")
+        return total
+
+    # Without a known size or hash there is no way to tell a complete file
+    # from a connection that closed early, so the download is rejected.
+    def _verify(self, part_path, total, expected_sha256):
+        if total is None and not expected_sha256:
+            raise DownloadVerificationError(f"{part_path}: server sent no size and no sha256 was given")
+        size = os.path.getsize(part_path)
+        if total is not None and size != total:
+            raise DownloadVerificationError(f"{part_path}: got {size} bytes, expected {total}")
+        if expected_sha256:
+            digest = hashlib.sha256()
+            with open(part_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            if digest.hexdigest() != expected_sha256.lower():
+                raise DownloadVerificationError(f"{part_path}: sha256 mismatch")
+
+    # Download url to local_path through a .part file that survives restarts;
+    # local_path only appears once the download is complete and verified.
+    def download_file(self, url, local_path, timeout=None, expected_sha256=None):
+        if os.path.exists(local_path):
+            return local_path
+
+        part_path = local_path + ".part"
+        state_path = part_path + ".json"
+        total = self._with_retries(lambda: self._download_attempt(url, part_path, state_path, timeout), url)
+
+        try:
+            self._verify(part_path, total, expected_sha256)
+        except DownloadVerificationError:
+            os.remove(part_path)
+            os.remove(state_path)
+            raise
+
+        os.replace(part_path, local_path)
+        os.remove(state_path)
+        return local_path
@@ -1,14 +1,15 @@
 # Download WARC files
 # data_access/warc_downloader.py
 import os
-import requests
 import gzip
 from config import settings
+from data_access.http_fetcher import HTTPFetcher
 
 
 class WARCDownloader:
-    def __init__(self, download_dir=settings.EXTRACTED_DATA_PATH):
+    def __init__(self, download_dir=settings.EXTRACTED_DATA_PATH, fetcher=None):
         self.download_dir = download_dir
+        self.fetcher = fetcher or HTTPFetcher()
         os.makedirs(self.download_dir, exist_ok=True)
 
     def download_and_get_warc_paths(self):
@@ -17,9 +18,8 @@ class WARCDownloader:
         # Download warc.paths.gz
         if not os.path.exists(warc_paths_file):
             print(f"Downloading WARC paths from {settings.COMMON_CRAWL_INDEX}")
-            response = requests.get(settings.COMMON_CRAWL_INDEX, stream=True)
-            with open(warc_paths_file, "wb") as f:
-                f.write(response.content)
+            self.fetcher.download_file(settings.COMMON_CRAWL_INDEX, warc_paths_file,
+                                       timeout=settings.WARC_DOWNLOAD_TIMEOUT)
 
         # Extract first N warc file paths
         warc_urls = []
@@ -33,11 +33,9 @@ class WARCDownloader:
 
     def download_warc_file(self, warc_url):
         local_filename = os.path.join(self.download_dir, os.path.basename(warc_url))
+        # Partial downloads live in a .part file, so an existing file is complete
         if not os.path.exists(local_filename):
             print(f"Downloading WARC file: {warc_url}")
-            response = requests.get(warc_url, stream=True)
-            with open(local_filename, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            self.fetcher.download_file(warc_url, local_filename, timeout=settings.WARC_DOWNLOAD_TIMEOUT)
         return local_filename
 
@@ -2,6 +2,8 @@
 from phases.phase1 import run_phase1
 from phases.phase2 import run_phase2
 from phases.phase3 import run_phase3
+from phases.phase4 import run_phase4
+from phases.export import run_export
 from data_access.database import DatabaseManager
 from utils.logging_utils import setup_logging
 import logging
@@ -13,9 +15,13 @@ if __name__ == "__main__":
     run_phase1()
     run_phase2()
     run_phase3()
+    run_phase4()
 
     db = DatabaseManager()
     logging.info("=== Final Database Statistics ===")
     logging.info(f"Articles stored: {db.get_article_count()}")
     logging.info(f"Images stored: {db.get_image_count()}")
     logging.info(f"Known faces stored: {db.get_known_faces_count()}")
+    logging.info(f"Person links stored: {db.get_person_link_count()}")
+
+    run_export()
@@ -0,0 +1,8 @@
+# Columnar export workflow
+# phases/export.py
+from services.export_service import ExportService
+
+def run_export():
+    print("=== Export: Writing articles, images and faces to columnar files ===")
+    service = ExportService()
+    service.export_tables()
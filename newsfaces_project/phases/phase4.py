@@ -0,0 +1,8 @@
+# Phase 4 workflow
+# phases/phase4.py
+from services.linking_service import LinkingService
+
+def run_phase4():
+    print("=== Phase 4: Linking article persons to recognized faces ===")
+    service = LinkingService()
+    service.link_persons()
@@ -0,0 +1,24 @@
+# services/export_service.py
+import logging
+from data_access.columnar_exporter import ColumnarExporter
+from data_access.database import DatabaseManager
+
+
+class ExportService:
+    def __init__(self):
+        self.db = DatabaseManager()
+        self.exporter = ColumnarExporter(self.db)
+
+    # Append rows added since the last export to the columnar dataset
+    def export_tables(self):
+        logging.info("=== Starting columnar export ===")
+        state = self.exporter.load_state()
+
+        exported = {
+            "articles": self.exporter.export_articles(state),
+            "images": self.exporter.export_images(state),
+            "known_faces": self.exporter.export_known_faces(state),
+        }
+
+        logging.info(f"=== Export complete: {exported} new rows written to {self.exporter.export_dir} ===")
+        return exported
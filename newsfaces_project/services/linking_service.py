@@ -0,0 +1,107 @@
+# services/linking_service.py
+import json
+import hashlib
+import logging
+from core.face_processing import FaceProcessor
+from core.person_linking import PersonNameIndex, FaceGallery
+from data_access.database import DatabaseManager
+from config import settings
+
+
+class LinkingService:
+    def __init__(self):
+        self.processor = FaceProcessor()
+        self.db = DatabaseManager()
+
+    # Gallery identities named in an article's text
+    def _article_candidates(self, name_index, person_entities):
+        try:
+            mentions = json.loads(person_entities) if person_entities else []
+        except ValueError:
+            mentions = []
+        return name_index.resolve(mentions)
+
+    # Best gallery match for each person in one image. Both match paths use
+    # confidence = (1 - face distance) * weight: the article path weights by
+    # how well the name matched (>= PERSON_FUZZY_THRESHOLD), the global path
+    # by GLOBAL_MATCH_WEIGHT, so at equal distance text-backed matches rank higher.
+    def _link_image(self, gallery, candidates, image_path):
+        best = {}
+        for encoding in self.processor.get_face_encodings(image_path):
+            match = gallery.match(encoding, candidates.keys()) if candidates else None
+            if match:
+                name, distance = match
+                confidence = (1.0 - distance) * candidates[name]
+                source = "article"
+            else:
+                # Nobody named in the text looks like this face; search the whole gallery
+                match = gallery.match(encoding, tolerance=settings.FACE_GLOBAL_TOLERANCE)
+                if not match:
+                    continue
+                name, distance = match
+                confidence = (1.0 - distance) * settings.GLOBAL_MATCH_WEIGHT
+                source = "global"
+
+            if confidence > best.get(name, (0.0, None))[0]:
+                best[name] = (confidence, source)
+        return best
+
+    # Identifies the gallery's distinct (name, encoding) pairs, so re-enrolling
+    # the same faces in Phase 3 does not force a rebuild
+    def _gallery_signature(self, known_faces):
+        digest = hashlib.sha256()
+        for name, encoding in sorted({(name, json.dumps(encoding)) for name, encoding in known_faces}):
+            digest.update(f"{name}\t{encoding}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _link_batches(self, gallery, name_index, last_image_id, stats):
+        # Images come back in id order, grouped by article, so only the
+        # current article's candidates need to be kept
+        current_article_id, candidates = None, {}
+
+        for rows in self.db.iter_images_with_articles(last_image_id, settings.LINK_BATCH_SIZE):
+            links = []
+            for image_id, article_id, image_path, person_entities in rows:
+                if article_id != current_article_id:
+                    current_article_id = article_id
+                    candidates = self._article_candidates(name_index, person_entities)
+                for name, (confidence, source) in self._link_image(gallery, candidates, image_path).items():
+                    links.append((article_id, image_id, name, confidence, source))
+                    stats[source] += 1
+                stats["images"] += 1
+
+            stats["links"] += len(links)
+            logging.info(f"Linked {stats['images']} images so far, {stats['links']} person links")
+            yield links, rows[-1][0]
+
+    def link_persons(self):
+        logging.info("=== Phase 4: Linking article persons to recognized faces ===")
+
+        known_faces = self.db.get_known_faces()
+        if not known_faces:
+            logging.warning("No known faces enrolled. Run Phase 3 first.")
+            return
+
+        gallery = FaceGallery(known_faces)
+        name_index = PersonNameIndex(gallery.identities())
+        logging.info(f"Gallery: {len(gallery.identities())} identities, {len(known_faces)} encodings")
+
+        # Only images added since the last run are linked, unless the gallery
+        # changed, in which case every image is relinked against it
+        signature = self._gallery_signature(known_faces)
+        last_image_id, previous_signature = self.db.get_link_state()
+        rebuild = signature != previous_signature
+        if rebuild:
+            last_image_id = 0
+            logging.info("Gallery changed since the last run: relinking all images")
+        else:
+            logging.info(f"Linking images after id {last_image_id}")
+
+        stats = {"images": 0, "links": 0, "article": 0, "global": 0}
+        self.db.store_person_links(self._link_batches(gallery, name_index, last_image_id, stats),
+                                   rebuild, signature)
+
+        logging.info("=" * 50)
+        logging.info(f"Linking complete: {stats['links']} links from {stats['images']} images "
+                     f"({stats['article']} via article text, {stats['global']} via global search).")
+        logging.info("=" * 50)
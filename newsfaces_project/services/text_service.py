@@ -1,8 +1,8 @@
 import os
-import json
 import logging
 from core.text_processing import TextMetadataExtractor
 from data_access.database import DatabaseManager
+from data_access.file_manager import FileManager
 from config import settings
 
 logger = logging.getLogger(__name__)
@@ -12,23 +12,20 @@ class TextService:
     def __init__(self):
         self.extractor = TextMetadataExtractor()
         self.db = DatabaseManager()
+        self.file_manager = FileManager()
 
     def process_html_files(self):
         logging.info("=== Starting Phase 2: Text metadata extraction ===")
-        mappings_file = os.path.join(settings.EXTRACTED_DATA_PATH, "mappings.json")
-
-        if not os.path.exists(mappings_file):
-            logging.error("No mappings.json found. Run Phase 1 first.")
+        if not os.path.exists(settings.MAPPINGS_PATH):
+            logging.error("No mappings.jsonl found. Run Phase 1 first.")
             return
 
-        with open(mappings_file, "r", encoding="utf-8") as f:
-            mappings = json.load(f)
-
-        logging.info(f"Processing {len(mappings)} HTML files from mappings.json")
+        logging.info(f"Processing HTML files from {settings.MAPPINGS_PATH}")
         processed = 0
+        batch = []
 
-        for idx, mapping in enumerate(mappings, start=1):
-            html_path = os.path.join(settings.BASE_DATA_PATH, mapping.get("html_path", ""))
+        for idx, mapping in enumerate(self.file_manager.iter_mappings(), start=1):
+            html_path = os.path.join(settings.BASE_DATA_PATH, mapping.html_path)
             if not os.path.exists(html_path):
                 logging.warning(f"[{idx}] HTML file not found: {html_path}")
                 continue
@@ -40,18 +37,28 @@ class TextService:
                 logging.warning(f"[{idx}] Error reading HTML file {html_path}: {e}")
                 continue
 
-            meta = {"target_uri": mapping.get("url") or mapping.get("target_uri")}
-            article_data = self.extractor.process_text_metadata(html_content, meta)
+            record = self.extractor.process_text_metadata(html_content, {"target_uri": mapping.url})
+            record.image_paths = tuple(os.path.join(settings.BASE_DATA_PATH, img) for img in mapping.images)
+            batch.append(record)
 
-            article_id = self.db.insert_article(article_data)
-            if article_id:
-                for img_rel in mapping.get("images", []):
-                    img_full = os.path.join(settings.BASE_DATA_PATH, img_rel)
-                    self.db.insert_image(article_id, img_full)
+            if len(batch) >= settings.ARTICLE_BATCH_SIZE:
+                processed += self._flush(batch)
+
+        processed += self._flush(batch)
+        logging.info(f"=== Phase 2 complete: {processed} articles processed ===")
+
+    # Persist a batch and release its records (and their cleaned text)
+    def _flush(self, batch):
+        if not batch:
+            return 0
 
-                processed += 1
-                logging.info(f"[{idx}] Stored article_id={article_id} title={article_data['title'][:80]} images={len(mapping.get('images', []))}")
+        stored = 0
+        for article_id, record in zip(self.db.insert_articles(batch), batch):
+            if article_id:
+                stored += 1
+                logging.info(f"Stored article_id={article_id} title={record.title[:80]} images={len(record.image_paths)}")
             else:
-                logging.error(f"[{idx}] Failed to store article for {meta.get('target_uri')}")
+                logging.error(f"Failed to store article for {record.target_uri}")
 
-        logging.info(f"=== Phase 2 complete: {processed} articles processed ===")
+        batch.clear()
+        return stored
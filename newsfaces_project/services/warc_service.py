@@ -1,66 +1,110 @@
 # services/warc_service.py
 import os
+import heapq
 import logging
 from urllib.parse import urlparse
 from warcio.archiveiterator import ArchiveIterator
 from warcio.exceptions import ArchiveLoadFailed
 from data_access.warc_downloader import WARCDownloader
+from data_access.http_fetcher import HTTPFetcher
 from core.warc_processing import extract_image_urls
+from core.page_scoring import score_page
+from core.records import PageMapping
 from data_access.file_manager import FileManager
 from config import settings
 
 class WARCService:
     def __init__(self):
-        self.downloader = WARCDownloader()
-        self.file_manager = FileManager()
-        self.mappings = []
+        fetcher = HTTPFetcher()
+        self.downloader = WARCDownloader(fetcher=fetcher)
+        self.file_manager = FileManager(fetcher=fetcher)
+        self.page_count = 0
+
+    # Score every HTML response in a WARC file and keep the best `budget` of
+    # them (above settings.MIN_PAGE_SCORE) in a min-heap.
+    def _select_candidates(self, local_file, budget):
+        candidates = []
+        if budget <= 0:
+            return candidates
+
+        scanned = 0
+        with open(local_file, "rb") as stream:
+            for record in ArchiveIterator(stream):
+                if scanned >= settings.MAX_SCORED_RECORDS_PER_WARC:
+                    break
+                if (
+                    record.rec_type != "response"
+                    or "text/html" not in record.http_headers.get_header("Content-Type", "")
+                ):
+                    continue
+
+                scanned += 1
+                url = record.rec_headers.get_header("WARC-Target-URI")
+                content_stream = record.content_stream()
+                body_prefix = content_stream.read(settings.SCORE_PREFIX_BYTES)
+
+                score = score_page(url, record.http_headers, body_prefix)
+                if score < settings.MIN_PAGE_SCORE:
+                    continue
+                if len(candidates) >= budget and score <= candidates[0][0]:
+                    continue
+
+                # Only read the rest of the body for pages we keep
+                entry = (score, scanned, url, body_prefix + content_stream.read())
+                if len(candidates) < budget:
+                    heapq.heappush(candidates, entry)
+                else:
+                    heapq.heapreplace(candidates, entry)
+
+        logging.info(f"Scored {scanned} HTML records, kept {len(candidates)} candidates")
+        return candidates
+
+    def _save_page(self, url, html_content, html_count):
+        html_filename = os.path.basename(urlparse(url).path) or f"page_{html_count}.html"
+        html_path = self.file_manager.save_html(html_content, html_filename)
+
+        image_urls = extract_image_urls(html_content, url)
+        saved_images = self.file_manager.download_images(
+            image_urls,
+            os.path.splitext(html_filename)[0]
+        )
+
+        # Store paths relative to the data dir; written out right away
+        self.file_manager.append_mapping(PageMapping(
+            url=url,
+            html_path=os.path.relpath(html_path, start=settings.BASE_DATA_PATH),
+            images=tuple(os.path.relpath(img, start=settings.BASE_DATA_PATH) for img in saved_images)
+        ))
+        self.page_count += 1
 
     def process_warc_files(self):
         logging.info("=== Starting Phase 1: WARC processing ===")
         warc_urls = self.downloader.download_and_get_warc_paths()
+        self.file_manager.reset_mappings()
 
         html_count = 0
         warc_count = 0
         total_warc_files = min(len(warc_urls), settings.MAX_WARC_FILES)
 
         for idx, warc_url in enumerate(warc_urls, start=1):
-            if warc_count >= settings.MAX_WARC_FILES:
+            if warc_count >= settings.MAX_WARC_FILES or html_count >= settings.MAX_HTML_PAGES:
                 break
 
-            local_file = self.downloader.download_warc_file(warc_url)
             warc_count += 1
+            try:
+                local_file = self.downloader.download_warc_file(warc_url)
+            except Exception as e:
+                logging.error(f"Skipping {warc_url} - download failed: {e}")
+                continue
 
             logging.info(f"[{idx}/{total_warc_files}] Processing WARC file: {os.path.basename(local_file)}")
 
             try:
-                with open(local_file, "rb") as stream:
-                    for record in ArchiveIterator(stream):
-                        if html_count >= settings.MAX_HTML_PAGES:
-                            break
-                        if (
-                            record.rec_type == "response"
-                            and "text/html" in record.http_headers.get_header("Content-Type", "")
-                        ):
-                            url = record.rec_headers.get_header("WARC-Target-URI")
-                            html_content = record.content_stream().read()
-
-                            html_filename = os.path.basename(urlparse(url).path) or f"page_{html_count}.html"
-                            html_path = self.file_manager.save_html(html_content, html_filename)
-
-                            image_urls = extract_image_urls(html_content, url)
-                            saved_images = self.file_manager.download_images(
-                                image_urls,
-                                os.path.splitext(html_filename)[0]
-                            )
-
-                            # Store paths in js
-                            self.mappings.append({
-                                "url": url,
-                                "html_path": os.path.relpath(html_path, start=settings.BASE_DATA_PATH),
-                                "images": [os.path.relpath(img, start=settings.BASE_DATA_PATH) for img in saved_images]
-                            })
-
-                            html_count += 1
+                candidates = self._select_candidates(local_file, settings.MAX_HTML_PAGES - html_count)
+                for score, _, url, html_content in sorted(candidates, reverse=True):
+                    self._save_page(url, html_content, html_count)
+                    logging.info(f"Kept page (score={score}): {url}")
+                    html_count += 1
             except ArchiveLoadFailed as e:
                 logging.warning(f"Skipping file {os.path.basename(local_file)} - not a valid WARC: {e}")
                 continue
@@ -68,6 +112,5 @@ class WARCService:
                 logging.error(f"Error processing {os.path.basename(local_file)}: {e}", exc_info=True)
                 continue
 
-        self.file_manager.save_mappings(self.mappings)
-        logging.info(f"=== Phase 1 complete: {len(self.mappings)} HTML pages processed ===")
-        return self.mappings
+        logging.info(f"=== Phase 1 complete: {self.page_count} HTML pages processed ===")
+        return self.page_count